@@ -9,7 +9,9 @@ import pytest
 # ======================================================================================================================
 # Globals
 # ======================================================================================================================
-ENV_VARS = ['JENKINS_CONSOLE_LOG_URL',
+hookimpl = pytest.hookimpl
+
+ENV_VARS = ('JENKINS_CONSOLE_LOG_URL',
             'SCENARIO',
             'ACTION',
             'IMAGE',
@@ -17,17 +19,35 @@ ENV_VARS = ['JENKINS_CONSOLE_LOG_URL',
             'PYTHON_ARTIFACT_SHA',
             'APT_ARTIFACT_SHA',
             'GIT_REPO',
-            'GIT_BRANCH']
+            'GIT_BRANCH')
 
 
 # ======================================================================================================================
 # Functions
 # ======================================================================================================================
-@pytest.hookimpl(tryfirst=True)
+def pytest_addoption(parser):
+    parser.addini('rpc-env-dump-all',
+                  'Write every RPC environment variable to the JUnitXML properties, using "Unknown" for unset ones.',
+                  type='bool',
+                  default=False)
+
+
+@hookimpl(tryfirst=True)
 def pytest_runtestloop(session):
-    if session.config.pluginmanager.hasplugin('junitxml'):
-            junit_xml_config = getattr(session.config, '_xml', None)
+    config = session.config
+    junit_xml_config = getattr(config, '_xml', None)
+
+    if not junit_xml_config:
+        return
+
+    add_global_property = junit_xml_config.add_global_property
+    env_get = os.environ.get
 
-            if junit_xml_config:
-                for env_var in ENV_VARS:
-                    junit_xml_config.add_global_property(env_var, os.getenv(env_var, 'Unknown'))
+    if config.getini('rpc-env-dump-all'):
+        for env_var in ENV_VARS:
+            add_global_property(env_var, env_get(env_var, 'Unknown'))
+    else:
+        for env_var in ENV_VARS:
+            value = env_get(env_var)
+            if value is not None:
+                add_global_property(env_var, value)
@@ -103,6 +103,29 @@ def test_no_env_vars_set(testdir):
     assert result.ret == 0
     dom.find_first_by_tag("testsuite").assert_attr(name="pytest", errors=0, failures=0, skips=0, tests=1)
 
+    assert dom.find_first_by_tag('property') is None
+
+
+def test_no_env_vars_set_dump_all(testdir):
+    """Make sure that unset environment variables are written as 'Unknown' when 'rpc-env-dump-all' is enabled."""
+
+    # Setup
+    testdir.makepyfile("""
+                import pytest
+                def test_pass():
+                    pass
+    """)
+    testdir.makeini("""
+                [pytest]
+                rpc-env-dump-all = true
+    """)
+
+    result, dom = runandparse(testdir)
+
+    # Test
+    assert result.ret == 0
+    dom.find_first_by_tag("testsuite").assert_attr(name="pytest", errors=0, failures=0, skips=0, tests=1)
+
     for i in range(len(ENV_VARS)):
         dom.find_nth_by_tag('property', i).assert_attr(name=ENV_VARS[i], value='Unknown')
 